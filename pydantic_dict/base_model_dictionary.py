@@ -8,6 +8,7 @@ from typing import (
     Iterable,
     Iterator,
     KeysView,
+    Optional,
     Set,
     Tuple,
     TypeVar,
@@ -16,17 +17,9 @@ from typing import (
 
 from typing_extensions import Self
 
-from functools import wraps
-from typing import Callable, Any, TypeVar
-from typing_extensions import ParamSpec
-
-from ._utils import getclsattr
 from ._sentinel import Sentinel
-from .exceptions import UnreachableException
 
 M = TypeVar("M", bound="BaseModelDict")
-P = ParamSpec("P")
-R = TypeVar("R", covariant=True)
 
 _unset_sentinel = Sentinel()
 
@@ -35,30 +28,14 @@ def _unset_sentinel_singleton():
     return _unset_sentinel
 
 
-def _raise_type_error_if_immutable(fn: Callable[P, R]) -> Callable[P, R]:
-    @wraps(fn)
-    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-        self = args[0]
-
-        disallow_mutation = getclsattr(type(self), "Config.frozen", False) | (
-            not getclsattr(type(self), "Config.allow_mutation", True)
-        )
-
-        if disallow_mutation:
-            raise TypeError(
-                f'"{type(self).__name__}" is immutable and does not support item assignment'
-            )
-
-        return fn(*args, **kwargs)
-
-    return wrapper
+def _immutable_type_error(m: "BaseModelDict") -> TypeError:
+    return TypeError(
+        f'"{type(m).__name__}" is immutable and does not support item assignment'
+    )
 
 
-def _raise_value_error_if_extra_fields_not_allowed(m: BaseModel):
-    extra = getclsattr(type(m), "Config.extra", None)
-    if extra is None:
-        raise UnreachableException()
-    if extra != Extra.allow:
+def _raise_value_error_if_extra_fields_not_allowed(m: "BaseModelDict"):
+    if type(m)._extra_policy is not Extra.allow:
         raise ValueError(f'"{type(m).__name__}" does not allow extra fields.')
 
 
@@ -91,66 +68,92 @@ class BaseModelDict(BaseModel):
         `pydantic.ValidationError`. However, `update()` _guarantees_ if a `pydantic.ValidationError`
         is thrown, `__dict__` will _not_ be left in a partially updated state. Meaning, the
         pre-`update()` state of `__dict__` will be restored. A performance penalty is taken to
-        guarantee this. A deep copy of `__dict__` is taken for roll-back purposes. The
+        guarantee this. A shallow copy of `__dict__` is taken for roll-back purposes. The
         `update_unsafe()` method is provided if you need to avoid this performance penalty. Note,
         `update_unsafe()` operates the same as `update()` when `Config.validate_assignment` if off.
+
+        - `__iter__()`, `keys()`, `items()`, and `values()` return snapshots, not live views.
+        Mutating a `BaseModelDict` while iterating over it is allowed and changes made after
+        calling `keys()`, `items()`, or `values()` are not reflected in the returned object.
     """
 
     __SENTINEL: ClassVar[object] = object()
-    _default_unset: ClassVar[FrozenSet[str]]
+    _default_unset: ClassVar[FrozenSet[str]] = frozenset()
     """set of fields on a _subclass_ with default value, `Unset`"""
 
-    _unset: Set[str] = PrivateAttr(default_factory=set)
+    _field_names: ClassVar[FrozenSet[str]] = frozenset()
+    """set of field names on a _subclass_"""
+
+    # `Config` flags resolved once per _subclass_ in `__init_subclass__`
+    _immutable_flag: ClassVar[bool] = False
+    _validate_assignment_flag: ClassVar[bool] = False
+    _extra_policy: ClassVar[Extra] = Extra.allow
+
+    # replaced, never mutated; instances share `_default_unset` until a field is set
+    _unset: FrozenSet[str] = PrivateAttr(default=frozenset())
     """set of fields on an _instance_ that _are_, currently, `Unset`"""
 
     class Config(BaseModel.Config):
         extra = Extra.allow
 
     def __init_subclass__(cls) -> None:
+        cls._field_names = frozenset(cls.__fields__)
+        unset_factory = _unset_sentinel_singleton
         cls._default_unset = frozenset(
             name
             for name, field in cls.__fields__.items()
-            if field.default_factory == _unset_sentinel_singleton
+            if field.default_factory is unset_factory
         )
+        # pydantic merges `Config` through the mro into `__config__`
+        config = cls.__config__
+        cls._immutable_flag = config.frozen or not config.allow_mutation
+        cls._validate_assignment_flag = config.validate_assignment
+        cls._extra_policy = config.extra
         return super().__init_subclass__()
 
     def __init__(self, **data: Any) -> None:
         super().__init__(**data)
-
-        # filter fields that were set during __init__ by `Unset` by default.
-        self._unset = set(
-            field
-            for field in self._default_unset
-            if self.__dict__[field] == _unset_sentinel
-        )
-
-    def _field_unset(self, key: str) -> bool:
-        return key in self._unset
+        self._init_unset()
+
+    def _init_unset(self) -> None:
+        # filter fields that were set during construction by `Unset` by default.
+        default_unset = type(self)._default_unset
+        if default_unset:
+            d = self.__dict__
+            if all(d[field] is _unset_sentinel for field in default_unset):
+                # share the class's frozenset; common case
+                self._unset = default_unset
+            else:
+                self._unset = frozenset(
+                    field for field in default_unset if d[field] is _unset_sentinel
+                )
 
     def __contains__(self, key: str) -> bool:
-        if self._field_unset(key):
-            return False
+        return key in self.__dict__ and (not self._unset or key not in self._unset)
 
-        return key in self.__dict__
-
-    @_raise_type_error_if_immutable
     def __delitem__(self, key: str):
-        if key in self.__fields__:
+        if type(self)._immutable_flag:
+            raise _immutable_type_error(self)
+
+        if key in type(self)._field_names:
             raise KeyError("Deleting non-extra fields is forbidden.")
 
         del self.__dict__[key]
 
     def __getitem__(self, key: str) -> Any:
-        if self._field_unset(key):
+        value = self.__dict__[key]
+        if self._unset and key in self._unset:
             raise KeyError(key)
-        return self.__dict__[key]
+        return value
 
     def __len__(self) -> int:
+        if not self._unset:
+            return len(self.__dict__)
         return len(self.__dict__) - len(self._unset)
 
     def __setattr__(self, name: str, value: Any):
         # remove field if now set
-        if name in self._unset and value != _unset_sentinel:
+        if name in self._unset and value is not _unset_sentinel:
             # pop to preserve dictionary ordering. dictionary insertion order if
             # lifo in python >= 3.7
             old_value = self.__dict__.pop(name)
@@ -162,7 +165,7 @@ class BaseModelDict(BaseModel):
                 # maintained, but the dictionary will be preserved.
                 self.__dict__[name] = old_value
                 raise e
-            self._unset.remove(name)
+            self._unset = self._unset - {name}
             return
         super().__setattr__(name, value)
 
@@ -171,15 +174,29 @@ class BaseModelDict(BaseModel):
         setattr(self, key, value)
 
     def __iter__(self) -> Iterator[str]:
+        # iterate a snapshot of the keys so the model can be mutated while iterating
+        if not self._unset:
+            return iter(list(self.__dict__))
         # filter `Unset` fields
-        return set(self.__dict__).difference(self._unset).__iter__()
+        unset = self._unset
+        return iter([k for k in self.__dict__ if k not in unset])
 
-    @_raise_type_error_if_immutable
     def clear(self):
         """Remove all non-extra fields."""
-        keys_to_remove = set(self.__dict__).difference(self.__fields__)
-        for key in keys_to_remove:
-            del self.__dict__[key]
+        if type(self)._immutable_flag:
+            raise _immutable_type_error(self)
+
+        field_names = type(self)._field_names
+        d = self.__dict__
+        for key in [k for k in d if k not in field_names]:
+            del d[key]
+
+    @classmethod
+    def construct(cls, _fields_set: Optional[Set[str]] = None, **values: Any) -> Self:
+        """`pydantic.BaseModel.construct` that also tracks fields that are `Unset`."""
+        m = super().construct(_fields_set, **values)
+        m._init_unset()
+        return m
 
     @classmethod
     def fromkeys(cls, iterable: Iterable[Any], value: Any = None) -> Self:
@@ -191,35 +208,42 @@ class BaseModelDict(BaseModel):
         return self[key]
 
     def items(self) -> ItemsView[str, Any]:
-        return {k: v for k, v in self.__dict__.items() if k not in self._unset}.items()
+        return self._snapshot().items()
 
     def keys(self) -> KeysView[str]:
-        return {k: None for k in self.__dict__.keys() if k not in self._unset}.keys()
+        return self._snapshot().keys()
 
-    @_raise_type_error_if_immutable
     def pop(self, key: str, default: Any = __SENTINEL) -> Any:
-        if key in self.__fields__:
+        if type(self)._immutable_flag:
+            raise _immutable_type_error(self)
+
+        if key in type(self)._field_names:
             raise KeyError("Deleting non-extra fields is forbidden.")
 
-        if default == self.__SENTINEL:
+        if default is self.__SENTINEL:
             return self.__dict__.pop(key)
 
         return self.__dict__.pop(key, default)
 
-    @_raise_type_error_if_immutable
     def popitem(self) -> Tuple[str, Any]:
+        if type(self)._immutable_flag:
+            raise _immutable_type_error(self)
+
         # SAFETY: Changed in version 3.7: Dictionary order is guaranteed to be insertion order.
         # see: https://docs.python.org/3.7/library/stdtypes.html#dict.values
+        field_names = type(self)._field_names
         for key in self.__dict__:
-            if key not in self.__fields__:
+            if key not in field_names:
                 return key, self.__dict__.pop(key)
 
         raise KeyError(
             "popitem(): dictionary is empty or all items in dictionary are model fields"
         )
 
-    @_raise_type_error_if_immutable
     def setdefault(self, key: str, default: Any = None):
+        if type(self)._immutable_flag:
+            raise _immutable_type_error(self)
+
         try:
             return self[key]
         except KeyError:
@@ -228,7 +252,6 @@ class BaseModelDict(BaseModel):
 
         return default
 
-    @_raise_type_error_if_immutable
     def update(self, values: Dict[str, Any]):
         """
         Update the dictionary with the key/value pairs from `values`, overwriting existing keys.
@@ -237,7 +260,7 @@ class BaseModelDict(BaseModel):
         `pydantic.ValidationError`. However, `update()` _guarantees_ if a `pydantic.ValidationError`
         is thrown, `__dict__` will _not_ be left in a partially updated state. Meaning, the
         pre-`update()` state of `__dict__` will be restored. A performance penalty is taken to
-        guarantee this. A deep copy of `__dict__` is taken for roll-back purposes. The
+        guarantee this. A shallow copy of `__dict__` is taken for roll-back purposes. The
         `update_unsafe()` method is provided if you need to avoid this performance penalty. Note,
         `update_unsafe()` operates the same as `update()` when `Config.validate_assignment` if off.
 
@@ -250,27 +273,31 @@ class BaseModelDict(BaseModel):
         ValidationError
             This can only be raised if `Config.validate_assignment` is on.
         """
+        if type(self)._immutable_flag:
+            raise _immutable_type_error(self)
+
         # fail fast if extra fields are not allowed and present in `values`
-        for key in values:
-            if key not in self.__fields__:
-                _raise_value_error_if_extra_fields_not_allowed(self)
+        if type(self)._extra_policy is not Extra.allow:
+            field_names = type(self)._field_names
+            for key in values:
+                if key not in field_names:
+                    raise ValueError(
+                        f'"{type(self).__name__}" does not allow extra fields.'
+                    )
 
-        validate_assignment = getclsattr(
-            type(self), "Config.validate_assignment", False
-        )
         # field validation is off. fast branch.
-        if not validate_assignment:
+        if not type(self)._validate_assignment_flag:
             self.update_unsafe(values)
             return
 
         # field validation is on. It is possible while updating fields that validation fails and
         # `__dict__` is left in a partially updated state. For this reason, `__dict__` must be
-        # deep copied.  Then try and update with `values`, if there are exceptions, `__dict__` is
-        # replaced with the copy.
-        import copy
-
-        original_state = copy.deepcopy(self.__dict__)
-        original_unset = self._unset.copy()
+        # copied.  Then try and update with `values`, if there are exceptions, `__dict__` is
+        # replaced with the copy. A shallow copy suffices: assignment replaces values, it never
+        # mutates them. Note, pydantic replaces `__dict__` on each validated assignment (and root
+        # validators may touch other keys), so restoring only the keys in `values` is not enough.
+        original_state = self.__dict__.copy()
+        original_unset = self._unset
 
         try:
             for key, value in values.items():
@@ -282,7 +309,6 @@ class BaseModelDict(BaseModel):
             object.__setattr__(self, "_unset", original_unset)
             raise e
 
-    @_raise_type_error_if_immutable
     def update_unsafe(self, values: Dict[str, Any]):
         """
         Update the dictionary with the key/value pairs from `values`, overwriting existing keys even
@@ -295,10 +321,20 @@ class BaseModelDict(BaseModel):
         ----------
         values : Dict[str, Any]
         """
-        for field in values:
-            if field in self._unset:
-                self._unset.remove(field)
+        if type(self)._immutable_flag:
+            raise _immutable_type_error(self)
+
+        if self._unset and not self._unset.isdisjoint(values):
+            self._unset = self._unset.difference(values)
         self.__dict__.update(values)
 
     def values(self) -> ValuesView[Any]:
-        return {k: v for k, v in self.__dict__.items() if k not in self._unset}.values()
+        return self._snapshot().values()
+
+    def _snapshot(self) -> Dict[str, Any]:
+        # shallow copy of `__dict__` without `Unset` fields. backs the views returned by
+        # `items()`, `keys()`, and `values()`.
+        if not self._unset:
+            return self.__dict__.copy()
+        unset = self._unset
+        return {k: v for k, v in self.__dict__.items() if k not in unset}
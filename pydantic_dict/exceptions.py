@@ -1,2 +0,0 @@
-class UnreachableException(BaseException):
-    ...
@@ -1,7 +1,7 @@
 import pytest
 from pydantic import ValidationError
 from pydantic_dict import BaseModelDict
-from typing import Tuple
+from typing import Any, Callable, Tuple
 from typing_extensions import TypeAlias
 
 FieldKey: TypeAlias = str
@@ -13,39 +13,33 @@ class KVModel(BaseModelDict):
 
 
 class KVModelWithFieldValidation(KVModel):
-    key: str
-
     class Config(KVModel.Config):
         validate_assignment = True
 
 
 class KVModelFrozen(KVModel):
-    key: str
-
     class Config(KVModel.Config):
         frozen = True
 
 
 class KVModelIgnoreExtra(KVModel):
-    key: str
-
     class Config(KVModel.Config):
         extra = "ignore"
 
 
 class KVModelForbidExtra(KVModel):
-    key: str
-
     class Config(KVModel.Config):
         extra = "forbid"
 
 
 DataRetType = Tuple[KVModel, FieldKey, DictKey]
 
+EXPECTED_JSON = '{"key": "value", "key2": "value2"}'
+
 
 @pytest.fixture
 def data() -> DataRetType:
-    m = KVModel(key="value")
+    m = KVModel.construct(key="value")
     m["key2"] = "value2"
 
     return m, "key", "key2"
@@ -59,7 +53,7 @@ def data_with_validate_assignment() -> DataRetType:
     return m, "key", "key2"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def data_with_frozen_model() -> DataRetType:
     m = KVModelFrozen(key="value", key2="value2")
     return m, "key", "key2"
@@ -136,7 +130,7 @@ def test___hash__():
 
 def test___iter__(data: DataRetType):
     model, field_key, dict_key = data
-    assert set(iter(model)) == {field_key, dict_key}
+    assert tuple(iter(model)) == (field_key, dict_key)
 
 
 def test___len__(data: DataRetType):
@@ -184,8 +178,7 @@ def test_fromkeys():
     model_value = "value"
     model = KVModel.fromkeys(model_keys, model_value)
 
-    for key in model:
-        assert model[key] == model_value
+    assert dict(model.items()) == dict.fromkeys(model_keys, model_value)
 
     assert len(model) == 2
 
@@ -210,18 +203,16 @@ def test_items():
     assert collected_model == dict(key="value", key2="value2")
 
 
-def test_json(data: DataRetType):
-    import json
-
+def test_json():
     model = KVModel(key="value", key2="value2")
 
-    assert model.json() == json.dumps(model.dict())
+    assert model.json() == EXPECTED_JSON
 
 
 def test_keys():
     model = KVModel(key="value", key2="value2")
 
-    assert set(model.keys()) == {"key", "key2"}
+    assert tuple(model.keys()) == ("key", "key2")
 
 
 def test_parse_obj(data: DataRetType):
@@ -285,11 +276,38 @@ def test_update(data: DataRetType):
     assert "key3" in model
 
 
-def test_values(data: DataRetType):
+def test_values():
     model = KVModel(key="value1", key2="value2")
     assert list(model.values()) == ["value1", "value2"]
 
 
+def test_views(data: DataRetType):
+    model, field_key, dict_key = data
+    keys, items, values = model.keys(), model.items(), model.values()
+
+    # views are snapshots; later changes to the model are not reflected
+    model["key3"] = "value3"
+    del model[dict_key]
+    assert list(keys) == [field_key, dict_key]
+    assert list(items) == [(field_key, "value"), (dict_key, "value2")]
+    assert list(values) == ["value", "value2"]
+
+
+def test_mutating_while_iterating(data: DataRetType):
+    model, field_key, dict_key = data
+
+    for key in model:
+        if key != field_key:
+            del model[key]
+    assert list(model) == [field_key]
+
+    model[dict_key] = "value2"
+    for key in model.keys():
+        if key != field_key:
+            model.pop(key)
+    assert list(model) == [field_key]
+
+
 def test_update_with_validate_assignment(data_with_validate_assignment: DataRetType):
     model, model_key, _ = data_with_validate_assignment
 
@@ -299,6 +317,21 @@ def test_update_with_validate_assignment(data_with_validate_assignment: DataRetT
         model.update(more_testing_data)
 
 
+def test_update_with_validate_assignment_rolls_back(
+    data_with_validate_assignment: DataRetType,
+):
+    model, model_key, dict_key = data_with_validate_assignment
+    pre_op_dict = model.__dict__.copy()
+
+    # `key3` is set before validation of `model_key` fails
+    more_testing_data = {dict_key: "new_value", "key3": "value3", model_key: lambda: 42}
+    with pytest.raises(ValidationError):
+        model.update(more_testing_data)
+
+    assert "key3" not in model
+    assert pre_op_dict == model.__dict__
+
+
 def test_update_unsafe_with_validate_assignment(
     data_with_validate_assignment: DataRetType,
 ):
@@ -309,27 +342,27 @@ def test_update_unsafe_with_validate_assignment(
     assert "key3" in model
 
 
-def test_frozen_model_raises_on_mutation(data_with_frozen_model: DataRetType):
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        pytest.param(lambda m, k: m.popitem(), id="popitem"),
+        pytest.param(lambda m, k: m.clear(), id="clear"),
+        pytest.param(lambda m, k: m.__delitem__(k), id="__delitem__"),
+        pytest.param(lambda m, k: m.pop(k), id="pop"),
+        pytest.param(lambda m, k: m.setdefault(k, "42"), id="setdefault"),
+        pytest.param(lambda m, k: m.update({}), id="update"),
+        pytest.param(lambda m, k: m.update_unsafe({}), id="update_unsafe"),
+        pytest.param(lambda m, k: setattr(m, k, "42"), id="__setattr__"),
+        pytest.param(lambda m, k: m.__setitem__(k, "42"), id="__setitem__"),
+    ],
+)
+def test_frozen_model_raises_on_mutation(
+    data_with_frozen_model: DataRetType, mutate: Callable[[KVModel, str], Any]
+):
     model, _, dict_key = data_with_frozen_model
 
     with pytest.raises(TypeError):
-        model.popitem()
-    with pytest.raises(TypeError):
-        model.clear()
-    with pytest.raises(TypeError):
-        del model[dict_key]
-    with pytest.raises(TypeError):
-        model.pop(dict_key)
-    with pytest.raises(TypeError):
-        model.setdefault(dict_key, "42")
-    with pytest.raises(TypeError):
-        model.update({})
-    with pytest.raises(TypeError):
-        model.update_unsafe({})
-    with pytest.raises(TypeError):
-        setattr(model, dict_key, "42")
-    with pytest.raises(TypeError):
-        model[dict_key] = "42"
+        mutate(model, dict_key)
 
 
 def test_modifying_field_data_with_ignore_extras_enabled(
@@ -355,25 +388,26 @@ def test_raises_when_adding_data_to_non_field_with_ignore_extras_enabled(
 ):
     model, _, dict_key = data_with_ignore_extras
 
-    with pytest.raises(ValueError):
-        model[dict_key] = "value2"
-
-    with pytest.raises(ValueError):
-        model.setdefault(dict_key, "value2")
-
-    with pytest.raises(ValueError):
-        model.update({dict_key: "value2"})
+    adds_extra_field = (
+        lambda: model.__setitem__(dict_key, "value2"),
+        lambda: model.setdefault(dict_key, "value2"),
+        lambda: model.update({dict_key: "value2"}),
+    )
+    for add_extra_field in adds_extra_field:
+        with pytest.raises(ValueError):
+            add_extra_field()
 
 
 def test_raises_when_adding_data_to_non_field_with_forbid_extras_enabled(
     data_with_forbid_extras: DataRetType,
 ):
     model, _, dict_key = data_with_forbid_extras
-    with pytest.raises(ValueError):
-        model[dict_key] = "value2"
-
-    with pytest.raises(ValueError):
-        model.setdefault(dict_key, "value2")
 
-    with pytest.raises(ValueError):
-        model.update({dict_key: "value2"})
+    adds_extra_field = (
+        lambda: model.__setitem__(dict_key, "value2"),
+        lambda: model.setdefault(dict_key, "value2"),
+        lambda: model.update({dict_key: "value2"}),
+    )
+    for add_extra_field in adds_extra_field:
+        with pytest.raises(ValueError):
+            add_extra_field()
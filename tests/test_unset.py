@@ -3,7 +3,7 @@ from pydantic import ValidationError
 from pydantic_dict import BaseModelDict, Unset
 from pydantic_dict.base_model_dictionary import _unset_sentinel
 
-from typing import Tuple, Optional
+from typing import Any, Callable, Tuple, Optional
 from typing_extensions import TypeAlias
 
 FieldKey: TypeAlias = str
@@ -37,10 +37,12 @@ class KVModelForbidExtra(KVModel):
 
 DataRetType = Tuple[KVModel, FieldKey, FieldKey, DictKey]
 
+EXPECTED_JSON = '{"key": "value", "key2": "value2"}'
+
 
 @pytest.fixture
 def data() -> DataRetType:
-    m = KVModel(key="value")
+    m = KVModel.construct(key="value")
     m["key2"] = "value2"
 
     return m, "key", "unset_key", "key2"
@@ -54,7 +56,7 @@ def data_with_validate_assignment() -> DataRetType:
     return m, "key", "unset_key", "key2"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def data_with_frozen_model() -> DataRetType:
     m = KVModelFrozen(key="value", key2="value2")
     return m, "key", "unset_key", "key2"
@@ -158,7 +160,7 @@ def test___hash__():
 def test___iter__(data: DataRetType):
     # test `unset_key` is not included in iter
     model, field_key, unset_key, dict_key = data
-    assert set(iter(model)) == {field_key, dict_key}
+    assert tuple(iter(model)) == (field_key, dict_key)
 
 
 def test___len__(data: DataRetType):
@@ -198,6 +200,16 @@ def test_clear(data: DataRetType):
     assert dict_key not in model
 
 
+def test_construct():
+    model = KVModel.construct(key="value")
+    assert "unset_key" not in model
+    assert len(model) == 1
+
+    model = KVModel.construct(key="value", unset_key="value")
+    assert "unset_key" in model
+    assert len(model) == 2
+
+
 def test_copy(data: DataRetType):
     model, _, unset_key, _ = data
     copy = model.copy()
@@ -214,6 +226,15 @@ def test_copy(data: DataRetType):
     assert copy[unset_key] == "value"
 
 
+def test_copy_does_not_share_unset(data: DataRetType):
+    model, _, unset_key, _ = data
+    copy = model.copy()
+
+    copy[unset_key] = "value"
+    assert unset_key in copy
+    assert unset_key not in model
+
+
 def test_dict():
     model = KVModel(key="value")
     model["key2"] = "value2"
@@ -227,8 +248,7 @@ def test_fromkeys():
     model_value = "value"
     model = KVModel.fromkeys(model_keys, model_value)
 
-    for key in model:
-        assert model[key] == model_value
+    assert dict(model.items()) == dict.fromkeys(model_keys, model_value)
 
     assert len(model) == 2
     assert len(model.__dict__) != 2
@@ -254,24 +274,23 @@ def test_items():
     assert collected_model == dict(key="value", key2="value2")
 
 
-def test_json(data: DataRetType):
-    import json
-
+def test_json():
     model = KVModel(key="value", key2="value2")
 
+    # `Unset` fields are not json serializable
     with pytest.raises(TypeError):
-        assert model.json() == json.dumps(model.dict())
+        model.json()
 
-    assert model.json(exclude_unset=True) == json.dumps(model.dict(exclude_unset=True))
+    assert model.json(exclude_unset=True) == EXPECTED_JSON
 
 
 def test_keys():
     model = KVModel(key="value", key2="value2")
 
-    assert set(model.keys()) == {"key", "key2"}
+    assert tuple(model.keys()) == ("key", "key2")
 
     model.unset_key = "value"
-    assert set(model.keys()) == {"key", "key2", "unset_key"}
+    assert tuple(model.keys()) == ("key", "key2", "unset_key")
 
 
 def test_parse_obj(data: DataRetType):
@@ -324,7 +343,7 @@ def test_update(data: DataRetType):
     assert "unset_key" in model
 
 
-def test_values(data: DataRetType):
+def test_values():
     model = KVModel(key="value1", key2="value2")
     assert list(model.values()) == ["value1", "value2"]
 
@@ -332,12 +351,60 @@ def test_values(data: DataRetType):
     assert list(model.values()) == ["value1", "value2", "value3"]
 
 
+def test_views(data: DataRetType):
+    model, field_key, unset_key, dict_key = data
+    keys, items, values = model.keys(), model.items(), model.values()
+
+    assert len(keys) == len(items) == len(values) == 2
+    assert field_key in keys
+    assert unset_key not in keys
+    assert (dict_key, "value2") in items
+    assert "value2" in values
+    assert unset_key not in repr(keys)
+
+    # views can be iterated more than once
+    assert list(keys) == list(keys) == [field_key, dict_key]
+    assert list(reversed(keys)) == [dict_key, field_key]
+
+    # views are snapshots; later changes to the model are not reflected
+    model[unset_key] = "value"
+    del model[dict_key]
+    assert list(keys) == [field_key, dict_key]
+    assert list(items) == [(field_key, "value"), (dict_key, "value2")]
+    assert list(values) == ["value", "value2"]
+
+
+def test_views_with_validate_assignment(data_with_validate_assignment: DataRetType):
+    model, field_key, unset_key, dict_key = data_with_validate_assignment
+    keys = model.keys()
+
+    model[unset_key] = "value"
+    model["key3"] = "value3"
+    assert list(keys) == [field_key, dict_key]
+
+
+def test_mutating_while_iterating(data: DataRetType):
+    model, field_key, unset_key, dict_key = data
+    model["key3"] = "value3"
+
+    for key in model:
+        if key != field_key:
+            del model[key]
+    assert list(model) == [field_key]
+
+    model["key3"] = "value3"
+    for key in model.keys():
+        if key != field_key:
+            model.pop(key)
+    assert list(model) == [field_key]
+    assert unset_key not in model
+
+
 def test_update_with_validate_assignment(data_with_validate_assignment: DataRetType):
     model, model_key, unset_key, _ = data_with_validate_assignment
 
     pre_op_dict = model.__dict__.copy()
     copy = model.copy()
-    deep_copy = model.copy(deep=True)
 
     # force type validation error, cannot coerce a function type into a str
     # unset_key should remain Unset
@@ -346,8 +413,8 @@ def test_update_with_validate_assignment(data_with_validate_assignment: DataRetT
         model.update(more_testing_data)
 
     assert model == copy
-    assert model == deep_copy
     assert pre_op_dict == model.__dict__
+    assert unset_key not in model
 
 
 def test_update_unsafe_with_validate_assignment(
@@ -362,17 +429,22 @@ def test_update_unsafe_with_validate_assignment(
     assert unset_key not in model._unset
 
 
-def test_frozen_model_raises_on_mutation(data_with_frozen_model: DataRetType):
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        pytest.param(lambda m, k: m.pop(k), id="pop"),
+        pytest.param(lambda m, k: m.setdefault(k, "42"), id="setdefault"),
+        pytest.param(lambda m, k: setattr(m, k, "42"), id="__setattr__"),
+        pytest.param(lambda m, k: m.__setitem__(k, "42"), id="__setitem__"),
+    ],
+)
+def test_frozen_model_raises_on_mutation(
+    data_with_frozen_model: DataRetType, mutate: Callable[[KVModel, str], Any]
+):
     model, _, unset_key, _ = data_with_frozen_model
 
     with pytest.raises(TypeError):
-        model.pop(unset_key)
-    with pytest.raises(TypeError):
-        model.setdefault(unset_key, "42")
-    with pytest.raises(TypeError):
-        setattr(model, unset_key, "42")
-    with pytest.raises(TypeError):
-        model[unset_key] = "42"
+        mutate(model, unset_key)
 
     assert getattr(model, unset_key) == _unset_sentinel
 